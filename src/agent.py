@@ -1,15 +1,121 @@
 """Langchain SQL agent for querying weather data."""
 import logging
-from typing import Optional, Dict, Any
-from langchain_openai import ChatOpenAI
+import re
+from typing import Any, Callable, Dict, List, Optional
+import pandas as pd
+import sqlglot
+from sqlglot import exp
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain.agents import create_agent
 from langchain.tools import tool
+from src.llm_client import get_llm, run_async
 from src.utils.config import Config
 from src.schema_manager import SchemaManager
 from src.utils.bigquery_helper import BigQueryHelper
 
 logger = logging.getLogger(__name__)
 
+# Questions asking for examples get a few live sample rows in the prompt
+_SAMPLE_KEYWORDS_RE = re.compile(r"\b(examples?|samples?)\b", re.IGNORECASE)
+
+# Questions about the table layout that the schema description answers directly
+_SCHEMA_QUESTION_RE = re.compile(
+    r"(?:what|which|list|show(?:\s+me)?|describe)\s+(?:are\s+)?(?:the\s+)?(?:available\s+)?"
+    r"(?:columns|fields|schema)"
+    r"(?:\s+(?:are\s+available|exist|are\s+there))?"
+    r"(?:\s+(?:are\s+)?(?:in|of)\s+the\s+(?:table|data(?:set)?))?\s*\??",
+    re.IGNORECASE
+)
+
+
+# Results larger than this are summarized before being sent back to the LLM
+_SUMMARY_ROW_THRESHOLD = 50
+_SUMMARY_BYTES_THRESHOLD = 10_000
+_SUMMARY_EDGE_ROWS = 5
+
+# Reply the small model gives when a question should go to the large model
+_ESCALATION_SENTINEL = "I need to run a more complex analysis"
+
+# Kept terse: every token here is sent on every LLM call
+_SYSTEM_PROMPT = """Weather data expert answering questions from a BigQuery weather table via the execute_bigquery tool.
+- SELECT queries only.
+- Tool result starting with INVALID_QUERY: fix the query and resubmit.
+- Results are CSV (header row, floats rounded to 3 decimals). Large results come as "summary (N rows):" stats plus "head:"/"tail:" rows; aggregate in SQL for exact values.
+- Rows are keyed by FLOAT64 latitude/longitude, not place names; infer approximate place names from coordinates.
+- Use schema column names; build location buffers per the query guidelines.
+- Answer clearly for a human. Omit SQL unless asked. State any assumptions."""
+
+_ESCALATION_INSTRUCTION = f"""
+- If the answer needs multi-step analysis (trends, comparisons, correlations across many locations or time ranges), reply exactly: {_ESCALATION_SENTINEL}"""
+
+
+def _is_read_only(query: str) -> bool:
+    """
+    Check that generated SQL is a single read-only query.
+    
+    Parsing rather than keyword matching allows leading comments and
+    keywords inside string literals, and rejects scripts such as
+    "SELECT 1; EXPORT DATA ..." whatever statements follow the first.
+    
+    Args:
+        query: SQL query
+        
+    Returns:
+        True if the query is exactly one SELECT, set operation or WITH query
+        
+    Raises:
+        sqlglot.errors.SqlglotError: If the query cannot be parsed
+    """
+    statements = [statement for statement in sqlglot.parse(query, read="bigquery") if statement is not None]
+    return len(statements) == 1 and isinstance(statements[0], exp.Query)
+
+
+def _format_result(df: pd.DataFrame) -> str:
+    """
+    Format a query result for the LLM.
+    
+    Small results are returned in full; large ones are compressed to summary
+    statistics plus the first and last rows.
+    
+    Args:
+        df: Query result
+        
+    Returns:
+        CSV text, prefixed with section headers when summarized
+    """
+    df = df.round(3)
+    if len(df) <= _SUMMARY_ROW_THRESHOLD and df.memory_usage().sum() <= _SUMMARY_BYTES_THRESHOLD:
+        return df.to_csv(index=False)
+    
+    return (
+        f"summary ({len(df)} rows):\n"
+        + df.describe(include='all').round(3).to_csv()
+        + "\nhead:\n" + df.head(_SUMMARY_EDGE_ROWS).to_csv(index=False)
+        + "\ntail:\n" + df.tail(_SUMMARY_EDGE_ROWS).to_csv(index=False)
+    )
+
+
+class _TokenCallbackHandler(BaseCallbackHandler):
+    """Forwards streamed LLM tokens to a callback."""
+    
+    # Call on the event loop thread so tokens arrive in order
+    run_inline = True
+    
+    def __init__(self, on_token: Callable[[str], None]):
+        """
+        Initialize the handler.
+        
+        Args:
+            on_token: Called with each generated token
+        """
+        self.on_token = on_token
+    
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        """Forward a generated token."""
+        if token:
+            self.on_token(token)
+
+
 class WeatherAgent:
     """Langchain-based tool agent for weather data queries."""
     
@@ -18,68 +124,68 @@ class WeatherAgent:
         self.config = Config
         self.schema_manager = SchemaManager()
         self.bq_helper = BigQueryHelper(self.config.GCP_PROJECT_ID)
+        # The prompt prefix, LLM and agent are built on first query
+        self._prompt_prefix: Optional[str] = None
+        # Bumped on every invalidation so callers caching on the schema can notice
+        self.schema_version = 0
         self.llm = None
+        self.llm_large = None
         self.db = None
         self.agent = None
-        
-        self._initialize_agent()
+        self.agent_large = None
 
     def _initialize_agent(self) -> None:
-        """Initialize the LLM, database connection, and agent."""
+        """Initialize the LLMs, database connection, and agents."""
         try:
-            # Initialize OpenAI LLM
-            logger.info(f"Initializing LLM: {self.config.OPENAI_MODEL}")
-            self.llm = ChatOpenAI(
-                model=self.config.OPENAI_MODEL,
-                temperature=self.config.TEMPERATURE,
-                openai_api_key=self.config.OPENAI_API_KEY,
-                base_url='https://api.fuelix.ai/v1' # Custom base URL
-            )
-            
-            # Create tool wrapper for execute_query
+            # Create tool wrapper that validates and executes in a single call.
+            # The tool is async so parallel tool calls run their BigQuery jobs concurrently.
             @tool
-            def execute_bigquery(query: str) -> str:
-                """Execute a BigQuery SQL query and return results.
+            async def execute_bigquery(query: str) -> str:
+                """Validate a BigQuery SQL query with a dry run, then execute it and return results.
                 
                 Args:
                     query: SQL query to execute
                     
                 Returns:
-                    Query results as a string
-                """
-                df = self.bq_helper.execute_query(query)
-                return df
-            
-            @tool
-            def validate_query(query: str) -> bool:
-                """
-                Validate a SQL query without executing it using bigquery helper.
-                
-                Args:
-                    query: SQL query to validate
-                    
-                Returns:
-                    True if query is valid, False otherwise
+                    Query results as CSV with a header row, or a message starting with INVALID_QUERY:
+                    followed by the validation error if the query is invalid
                 """
                 try:
-                    return self.bq_helper.validate_query(query)
-                except Exception as e:
-                    logger.error(f"Query validation failed: {e}")
-                    return False
-
-            
-            # Create SQL agent
-            logger.info("Creating Langchain tool-calling agent") # TODO: Dynamic Model
-            self.agent = create_agent(                           # TODO: Include a cache mechanism, for common locations (cities) by polygons in a txt file, have the agent refer to it first
-                model=self.llm,
-                tools=[execute_bigquery, validate_query],
-                system_prompt= """You are a helpful weather data expert. You have access to BigQuery tools. 
-                Make sure that the query does not include any destructive methods before executing.
-                Always validate the query before execution. If the query is invalid, read the error message and write a corrected query.
-                The BigQuery table you have access to does sorts data by latitude and longitude as FLOAT64, not location name. 
-                If asked about location, analyze the resulting latitude and longitude to determine an approximate location name.
-                Make sure to use the correct column names as per the schema, and create location buffers following the schema guidelines."""
-            )
+                    read_only = _is_read_only(query)
+                except sqlglot.errors.SqlglotError as e:
+                    return f"INVALID_QUERY: Syntax error: {e}"
+                if not read_only:
+                    return "INVALID_QUERY: Only a single read-only SELECT query is allowed."
+                error = await self.bq_helper.get_validation_error_async(query)
+                if error is not None:
+                    return f"INVALID_QUERY: {error}"
+                df = await self.bq_helper.execute_query_async(query)
+                # CSV is far more compact than to_string() padding; rounding caps float tokens
+                return _format_result(df.head(self.config.MAX_QUERY_RESULTS))
+            
+            # Questions start on the small model and escalate to the large one when needed
+            logger.info("Creating Langchain tool-calling agents")
+            self.llm = get_llm(self.config.OPENAI_MODEL_SMALL, self.config.TEMPERATURE)
+            if self.config.OPENAI_MODEL_SMALL == self.config.OPENAI_MODEL_LARGE:
+                self.agent = create_agent(
+                    model=self.llm,
+                    tools=[execute_bigquery],
+                    system_prompt=_SYSTEM_PROMPT
+                )
+                self.llm_large = self.llm
+                self.agent_large = None
+            else:
+                self.agent = create_agent(
+                    model=self.llm,
+                    tools=[execute_bigquery],
+                    system_prompt=_SYSTEM_PROMPT + _ESCALATION_INSTRUCTION
+                )
+                self.llm_large = get_llm(self.config.OPENAI_MODEL_LARGE, self.config.TEMPERATURE)
+                self.agent_large = create_agent(
+                    model=self.llm_large,
+                    tools=[execute_bigquery],
+                    system_prompt=_SYSTEM_PROMPT
+                )
             # TODO: Vectorize fire data, and use metadata based filtering
             logger.info("Weather agent initialized successfully")
             
@@ -87,12 +193,22 @@ class WeatherAgent:
             logger.error(f"Error initializing agent: {e}")
             raise
     
-    def query(self, question: str) -> Dict[str, Any]:
+    def query(
+        self,
+        question: str,
+        context: Optional[str] = None,
+        on_token: Optional[Callable[[str], None]] = None,
+        on_reset: Optional[Callable[[], None]] = None
+    ) -> Dict[str, Any]:
         """
         Process a natural language query about weather data.
         
         Args:
             question: Natural language question about weather
+            context: Earlier conversation turns the question refers to, if any
+            on_token: Called with each LLM token as it is generated
+            on_reset: Called when the streamed tokens so far are discarded because
+                the question is re-run on the large model
             
         Returns:
             Dictionary containing the answer and metadata
@@ -100,27 +216,49 @@ class WeatherAgent:
         try:
             logger.info(f"Processing query: {question}")
             
+            # Schema questions need no SQL, so skip the agent loop entirely
+            if context is None and _SCHEMA_QUESTION_RE.fullmatch(question.strip()):
+                logger.info("Answering schema question from the schema description")
+                return {
+                    'question': question,
+                    'answer': self.schema_manager.get_schema_description(),
+                    'success': True
+                }
+            
+            if self.agent is None:
+                self._initialize_agent()
+            
             # Add schema context to the question
-            enhanced_question = self._enhance_question(question)
-            
-            # Execute the agent
-            result = self.agent.invoke(
-                {"messages": [{"role": "user", "content": enhanced_question}]}
-            )
-            
-            # Extract answer from messages
-            answer = "No answer generated"
-            if 'messages' in result and len(result['messages']) > 0:
-                # Get the last message (assistant's response)
-                last_message = result['messages'][-1]
-                if hasattr(last_message, 'content'):
-                    answer = last_message.content
-                elif isinstance(last_message, dict) and 'content' in last_message:
-                    answer = last_message['content']
+            enhanced_question = self._enhance_question(question, context)
+            
+            callbacks: List[BaseCallbackHandler] = []
+            if on_token is not None:
+                callbacks.append(_TokenCallbackHandler(on_token))
+            
+            # Execute the agent; the async path lets concurrent tool calls overlap
+            model = self.config.OPENAI_MODEL_SMALL
+            result = run_async(self.agent.ainvoke(
+                {"messages": [{"role": "user", "content": enhanced_question}]},
+                config={"callbacks": callbacks}
+            ))
+            answer = self._extract_answer(result)
+            
+            # Re-run hard questions on the large model
+            if self.agent_large is not None and self._needs_escalation(result, answer):
+                logger.info(f"Escalating query to {self.config.OPENAI_MODEL_LARGE}")
+                if on_reset is not None:
+                    on_reset()
+                model = self.config.OPENAI_MODEL_LARGE
+                result = run_async(self.agent_large.ainvoke(
+                    {"messages": [{"role": "user", "content": enhanced_question}]},
+                    config={"callbacks": callbacks}
+                ))
+                answer = self._extract_answer(result)
             
             response = {
                 'question': question,
                 'answer': answer,
+                'model': model,
                 'success': True
             }
             
@@ -136,42 +274,97 @@ class WeatherAgent:
                 'error': str(e)
             }
     
-    def _enhance_question(self, question: str) -> str:
+    def _extract_answer(self, result: Dict[str, Any]) -> str:
+        """
+        Extract the final answer from an agent result.
+        
+        Args:
+            result: Agent invocation result
+            
+        Returns:
+            Content of the last message, or a placeholder if there is none
+        """
+        answer = "No answer generated"
+        if 'messages' in result and len(result['messages']) > 0:
+            # Get the last message (assistant's response)
+            last_message = result['messages'][-1]
+            if hasattr(last_message, 'content'):
+                answer = last_message.content
+            elif isinstance(last_message, dict) and 'content' in last_message:
+                answer = last_message['content']
+        return answer
+    
+    def _needs_escalation(self, result: Dict[str, Any], answer: str) -> bool:
+        """
+        Decide whether the small model's attempt should be retried on the large model.
+        
+        Args:
+            result: Agent invocation result from the small model
+            answer: Answer extracted from the result
+            
+        Returns:
+            True if the small model flagged the question or used too many tool calls
+        """
+        if _ESCALATION_SENTINEL in str(answer):
+            return True
+        tool_calls = sum(
+            1 for message in result.get('messages', [])
+            if getattr(message, 'type', None) == 'tool'
+        )
+        return tool_calls > self.config.SMALL_MODEL_MAX_TOOL_CALLS
+    
+    def _enhance_question(self, question: str, context: Optional[str] = None) -> str:
         """
         Enhance the question with schema context.
         
         Args:
             question: Original question
+            context: Earlier conversation turns the question refers to, if any
             
         Returns:
             Enhanced question with context
         """
-        # Get schema context
-        schema_context = self.schema_manager.get_full_context(include_samples=False)
-        #TODO: Optimize SQL generation in step 2 for faster performance
-        enhanced = f"""
-You are a helpful assistant that answers questions about weather data stored in BigQuery.
-
-{schema_context}
-
-Important Instructions:
-1. Generate SQL queries to answer the user's question 
-2. Format your final answer in a clear, human-readable way
-3. Do not include the SQL query in your final answer unless explicitly requested
-4. If you need to make assumptions, state them clearly
-5. Only perform SELECT queries - no INSERT, UPDATE, or DELETE operations
-
-User Question: {question}
-"""
+        if self._prompt_prefix is None:
+            self._prompt_prefix = self._build_prompt_prefix()
+        
+        enhanced = f"{self._prompt_prefix}{question}\n"
+        if context:
+            enhanced += f"\n{context}"
+        
+        # Sample rows cost prompt tokens on every turn, so only add them when asked for
+        if _SAMPLE_KEYWORDS_RE.search(question):
+            enhanced += self.schema_manager.get_sample_data_description()
         
         return enhanced #TODO: Can add javascript within the SQL for more complex processing
     
-    def get_schema_info(self) -> str:
+    def _build_prompt_prefix(self) -> str:
+        """
+        Render the static part of the enhanced question, up to the user question.
+        
+        Returns:
+            Prompt prefix containing the schema context
+        """
+        # Get schema context; the instructions live in the system prompt
+        schema_context = self.schema_manager.get_full_context(include_samples=False)
+        #TODO: Optimize SQL generation in step 2 for faster performance
+        return f"{schema_context}\n\nQuestion: "
+    
+    def invalidate_schema_cache(self) -> None:
+        """Drop the cached schema context so the next query re-reads it."""
+        self.schema_manager.invalidate_cache()
+        self._prompt_prefix = None
+        self.schema_version += 1
+        logger.info("Schema context cache invalidated")
+    
+    def get_schema_info(self, include_samples: bool = True) -> str:
         """
         Get schema information for display.
         
+        Args:
+            include_samples: Whether to include sample data
+            
         Returns:
             Formatted schema information
         """
-        return self.schema_manager.get_full_context(include_samples=True)
+        return self.schema_manager.get_full_context(include_samples=include_samples)
     
\ No newline at end of file
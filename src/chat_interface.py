@@ -1,10 +1,15 @@
 """Chat interface for the weather agent."""
 
 import logging
-from typing import Optional
+import queue
+import threading
+import time
+from typing import Any, Dict, List
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.markdown import Markdown
+from rich.spinner import Spinner
 from rich.table import Table
 from rich import box
 from src.copilot import WeatherCopilot
@@ -12,6 +17,37 @@ from src.utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Streamed answer redraws per second
+_REFRESH_PER_SECOND = 10
+
+# Queue markers for the streaming worker: discard the tokens so far / end of stream
+_RESET = object()
+_DONE = object()
+
+WELCOME_TEXT = """
+# 🌤️  Weather Data Agent
+
+Welcome! I'm your AI assistant for querying weather data from BigQuery.
+
+**What I can do:**
+- Answer questions about current and historical weather
+- Provide weather statistics and trends
+- Query weather data by location, time, and conditions
+
+**Commands:**
+- `/help` - Show available commands
+- `/schema` - View database schema
+- `/status` - Check system status
+- `/exit` - Exit the application
+
+**Example queries:**
+- "What's the current weather in Toronto?"
+- "Show me temperature trends for Vancouver"
+- "Which locations had the highest temperature yesterday?"
+
+Type your question or command below to get started!
+"""
+
 
 class ChatInterface:
     """Command-line chat interface for the weather agent."""
@@ -22,6 +58,24 @@ class ChatInterface:
         self.copilot = WeatherCopilot()
         self.running = False
         
+        # Static panels are built once; the answer panel is reused every turn
+        self._welcome_panel = Panel(
+            Markdown(WELCOME_TEXT),
+            title="Weather Agent",
+            border_style="blue",
+            box=box.DOUBLE
+        )
+        self._goodbye_panel = Panel(
+            "[bold cyan]Thank you for using Weather Agent! Goodbye! 👋[/bold cyan]",
+            border_style="blue"
+        )
+        self._answer_panel = Panel(
+            "",
+            title="🤖 Assistant",
+            border_style="green",
+            box=box.ROUNDED
+        )
+        
     def start(self) -> None:
         """Start the chat interface."""
         self.running = True
@@ -56,45 +110,13 @@ class ChatInterface:
     
     def _display_welcome(self) -> None:
         """Display welcome message."""
-        welcome_text = """
-# 🌤️  Weather Data Agent
-
-Welcome! I'm your AI assistant for querying weather data from BigQuery.
-
-**What I can do:**
-- Answer questions about current and historical weather
-- Provide weather statistics and trends
-- Query weather data by location, time, and conditions
-
-**Commands:**
-- `/help` - Show available commands
-- `/schema` - View database schema
-- `/status` - Check system status
-- `/exit` - Exit the application
-
-**Example queries:**
-- "What's the current weather in Toronto?"
-- "Show me temperature trends for Vancouver"
-- "Which locations had the highest temperature yesterday?"
-
-Type your question or command below to get started!
-"""
-        
-        self.console.print(Panel(
-            Markdown(welcome_text),
-            title="Weather Agent",
-            border_style="blue",
-            box=box.DOUBLE
-        ))
+        self.console.print(self._welcome_panel)
         self.console.print()
     
     def _display_goodbye(self) -> None:
         """Display goodbye message."""
         self.console.print("\n")
-        self.console.print(Panel(
-            "[bold cyan]Thank you for using Weather Agent! Goodbye! 👋[/bold cyan]",
-            border_style="blue"
-        ))
+        self.console.print(self._goodbye_panel)
     
     def _get_user_input(self) -> str:
         """
@@ -116,9 +138,60 @@ Type your question or command below to get started!
         Args:
             user_input: User's input string
         """
-        # Show processing indicator
-        with self.console.status("[bold green]Processing your query...", spinner="dots"):
-            result = self.copilot.process_query(user_input)
+        # Run the query in the background and stream tokens as they arrive
+        tokens: "queue.Queue[Any]" = queue.Queue()
+        outcome: Dict[str, Any] = {}
+        
+        def worker() -> None:
+            try:
+                outcome['result'] = self.copilot.process_query(
+                    user_input,
+                    on_token=tokens.put,
+                    on_reset=lambda: tokens.put(_RESET)
+                )
+            finally:
+                tokens.put(_DONE)
+        
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        
+        # Show processing indicator until the first token, then the partial answer.
+        # The live view is transient; the final answer is printed below.
+        streamed: List[str] = []
+        spinner = Spinner("dots", text="[bold green]Processing your query...")
+        with Live(
+            spinner,
+            console=self.console,
+            refresh_per_second=_REFRESH_PER_SECOND,
+            transient=True
+        ) as live:
+            done = False
+            while not done:
+                # Take everything that arrived since the last redraw so the growing
+                # answer is parsed as Markdown at most once per refresh tick
+                batch = [tokens.get()]
+                while True:
+                    try:
+                        batch.append(tokens.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                for item in batch:
+                    if item is _DONE:
+                        done = True
+                    elif item is _RESET:
+                        # Escalated to the large model; drop the small model's partial reply
+                        streamed.clear()
+                        live.update(spinner)
+                    else:
+                        streamed.append(item)
+                
+                if streamed and not done:
+                    self._answer_panel.renderable = Markdown("".join(streamed))
+                    live.update(self._answer_panel)
+                    time.sleep(1 / _REFRESH_PER_SECOND)
+        thread.join()
+        result = outcome['result']
         
         # Display the response
         self._display_response(result)
@@ -145,12 +218,8 @@ Type your question or command below to get started!
                 ))
             else:
                 # Regular query response
-                self.console.print(Panel(
-                    Markdown(answer),
-                    title="🤖 Assistant",
-                    border_style="green",
-                    box=box.ROUNDED
-                ))
+                self._answer_panel.renderable = Markdown(answer)
+                self.console.print(self._answer_panel)
                 
                 # Display SQL queries if available
                 if 'sql_queries' in result and result['sql_queries']:
@@ -1,12 +1,56 @@
 """Copilot orchestration layer for the weather agent."""
 
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import string
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Deque, Dict, Any, List, Optional, Tuple
+from cachetools import TTLCache
 from src.agent import WeatherAgent
 from src.utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Small-talk inputs answered without calling the agent
+_GREETING_RE = re.compile(r"(hi|hello|hey|good (morning|afternoon|evening))\W*", re.IGNORECASE)
+_THANKS_RE = re.compile(
+    r"(thanks|thank you|thx|ty)(\s+(so much|a lot|again))*\W*",
+    re.IGNORECASE
+)
+
+# References to earlier turns that mark a question as a follow-up
+_FOLLOW_UP_RE = re.compile(
+    r"\b((that|this|the same) (city|place|location|area|day|time|period)"
+    r"|what about|how about|and (in|for)|those|them|instead|the above"
+    r"|(the )?previous (answer|result|query|question|one)|(mentioned|said|asked) earlier)\b",
+    re.IGNORECASE
+)
+
+# Plain current-weather questions for a single place, e.g. "What's the weather in Toronto now?"
+_CURRENT_WEATHER_RE = re.compile(
+    r"(?:(?:what's|what is|whats|show me|get me|tell me)\s+)?(?:the\s+)?(?:current\s+)?"
+    r"weather\s+(?:like\s+)?(?:in|for|at)\s+(?P<city>[a-z][a-z .'-]*?)"
+    r"(?:\s+(?:right now|now|currently|today))?\W*",
+    re.IGNORECASE
+)
+
+# City bounding boxes as (lat_min, lat_max, lon_min, lon_max)
+_CITY_POLYGONS_PATH = Path(__file__).resolve().parents[1] / "data" / "city_polygons.json"
+
+_CITY_WEATHER_QUERY = """
+SELECT valid_tm_lcl_str, tmprtr_amt, tmprtr_feel_like_amt, rel_humidity_amt,
+       wind_speed_amt, wind_dir_cardinal_str, wx_phrs_long_str
+FROM `{full_table}`
+WHERE rqst_lat_num BETWEEN @lat_min AND @lat_max
+  AND rqst_long_num BETWEEN @lon_min AND @lon_max
+ORDER BY snpsht_ts DESC
+LIMIT 1
+"""
+
 
 class WeatherCopilot:
     """
@@ -14,15 +58,44 @@ class WeatherCopilot:
     between the user, the Langchain agent, and the BigQuery data source.
     """
     
-    def __init__(self):
-        """Initialize the copilot."""
-        self.agent = WeatherAgent()
-        self.conversation_history: List[Dict[str, str]] = []
+    def __init__(self, agent: Optional[WeatherAgent] = None):
+        """
+        Initialize the copilot.
+        
+        Args:
+            agent: Weather agent to use; it holds no conversation state, so one
+                agent can be shared by several copilots. Created on first use if omitted.
+        """
+        self._agent: Optional[WeatherAgent] = agent
         self.config = Config
+        self.conversation_history: Deque[Dict[str, str]] = deque(
+            maxlen=self.config.MAX_HISTORY_MESSAGES
+        )
+        
+        # Exact-match cache of answers, keyed by _cache_key()
+        self._response_cache: TTLCache = TTLCache(
+            maxsize=self.config.RESPONSE_CACHE_SIZE,
+            ttl=self.config.RESPONSE_CACHE_TTL
+        )
+        self._schema_hash: Optional[str] = None
+        self._schema_version: Optional[int] = None
+        self._city_index = self._load_city_index()
         
         logger.info("Weather Copilot initialized")
     
-    def process_query(self, user_input: str) -> Dict[str, Any]:
+    @property
+    def agent(self) -> WeatherAgent:
+        """The weather agent, created on first use so startup stays fast."""
+        if self._agent is None:
+            self._agent = WeatherAgent()
+        return self._agent
+    
+    def process_query(
+        self,
+        user_input: str,
+        on_token: Optional[Callable[[str], None]] = None,
+        on_reset: Optional[Callable[[], None]] = None
+    ) -> Dict[str, Any]:
         """
         Process a user query through the complete pipeline.
         
@@ -34,6 +107,8 @@ class WeatherCopilot:
         
         Args:
             user_input: User's natural language query
+            on_token: Called with each LLM token as it is generated
+            on_reset: Called when the tokens streamed so far are superseded
             
         Returns:
             Dictionary containing the response and metadata
@@ -41,6 +116,9 @@ class WeatherCopilot:
         try:
             logger.info(f"Copilot processing query: {user_input}")
             
+            # Earlier turns are only sent to the agent for follow-up questions
+            context = self._get_follow_up_context(user_input)
+            
             # Add to conversation history
             self.conversation_history.append({
                 'role': 'user',
@@ -51,8 +129,42 @@ class WeatherCopilot:
             if user_input.lower().startswith('/'):
                 return self._handle_command(user_input)
             
+            # Answer trivial inputs without calling the LLM
+            fast_response = self._fast_path(user_input)
+            if fast_response is not None:
+                self.conversation_history.append({
+                    'role': 'assistant',
+                    'content': fast_response['answer']
+                })
+                return fast_response
+            
+            # Answer current weather for known cities with a direct query
+            city_response = self._city_lookup(user_input)
+            if city_response is not None:
+                self.conversation_history.append({
+                    'role': 'assistant',
+                    'content': city_response['answer']
+                })
+                return city_response
+            
+            # Serve repeated questions from the response cache
+            cache_key = self._cache_key(user_input, context)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Serving cached response")
+                self.conversation_history.append({
+                    'role': 'assistant',
+                    'content': cached['answer']
+                })
+                return {**cached, 'cached': True}
+            
             # Process through the agent
-            result = self.agent.query(user_input)
+            result = self.agent.query(
+                user_input,
+                context=context,
+                on_token=on_token,
+                on_reset=on_reset
+            )
             
             # Add response to conversation history
             if result['success']:
@@ -64,6 +176,10 @@ class WeatherCopilot:
             # Synthesize final response
             response = self._synthesize_response(result)
             
+            # Only cache successful answers so failures are retried
+            if response['success']:
+                self._response_cache[cache_key] = response
+            
             return response
             
         except Exception as e:
@@ -74,6 +190,160 @@ class WeatherCopilot:
                 'error': str(e)
             }
     
+    def _fast_path(self, user_input: str) -> Optional[Dict[str, Any]]:
+        """
+        Answer trivial inputs directly, without invoking the agent.
+        
+        Handles very short inputs, greetings, thanks, and an immediate repeat
+        of the previous question.
+        
+        Args:
+            user_input: User's natural language query
+            
+        Returns:
+            Response dictionary, or None if the input needs the agent
+        """
+        text = user_input.strip()
+        answer = None
+        
+        if _GREETING_RE.fullmatch(text):
+            answer = "Hello! Ask me anything about the weather data, or type /help for available commands."
+        elif _THANKS_RE.fullmatch(text):
+            answer = "You're welcome! Let me know if you have any other weather questions."
+        elif len(text) < 3:
+            answer = "Please ask a question about weather data, or type /help for available commands."
+        else:
+            # The current input is already the last history entry
+            previous = list(islice(reversed(self.conversation_history), 1, 3))[::-1]
+            if (
+                len(previous) == 2
+                and previous[0]['role'] == 'user'
+                and previous[1]['role'] == 'assistant'
+                and previous[0]['content'].strip().lower() == text.lower()
+            ):
+                answer = previous[1]['content']
+        
+        if answer is None:
+            return None
+        
+        logger.info("Answered query on the fast path")
+        return {
+            'success': True,
+            'answer': answer,
+            'question': user_input,
+            'fast_path': True
+        }
+    
+    @staticmethod
+    def _load_city_index() -> Dict[str, Tuple[float, float, float, float]]:
+        """
+        Load the bounding boxes of common cities.
+        
+        Returns:
+            Mapping of lowercase city name to (lat_min, lat_max, lon_min, lon_max)
+        """
+        try:
+            polygons = json.loads(_CITY_POLYGONS_PATH.read_text(encoding="utf-8"))
+            return {city.lower(): tuple(bounds) for city, bounds in polygons.items()}
+        except Exception as e:
+            logger.error(f"Error loading city polygons: {e}")
+            return {}
+    
+    def _city_lookup(self, user_input: str) -> Optional[Dict[str, Any]]:
+        """
+        Answer a current-weather question for a known city without the LLM.
+        
+        Args:
+            user_input: User's natural language query
+            
+        Returns:
+            Response dictionary, or None if the question needs the agent
+        """
+        match = _CURRENT_WEATHER_RE.fullmatch(user_input.strip())
+        if match is None:
+            return None
+        
+        city = match.group('city').strip().lower()
+        bounds = self._city_index.get(city)
+        if bounds is None:
+            return None
+        
+        lat_min, lat_max, lon_min, lon_max = bounds
+        try:
+            df = self.agent.bq_helper.execute_parameterized_query(
+                _CITY_WEATHER_QUERY.format(full_table=self.config.get_full_table_name()),
+                {'lat_min': lat_min, 'lat_max': lat_max, 'lon_min': lon_min, 'lon_max': lon_max}
+            )
+        except Exception as e:
+            logger.error(f"City lookup failed, falling back to the agent: {e}")
+            return None
+        
+        if df.empty:
+            return None
+        
+        row = df.iloc[0]
+        # The table stores amounts "in defined unit of measure" with no unit column,
+        # so no unit is assumed here
+        answer = (
+            f"**Current weather in {string.capwords(city)}** (as of {row['valid_tm_lcl_str']}):\n\n"
+            f"- Conditions: {row['wx_phrs_long_str']}\n"
+            f"- Temperature: {row['tmprtr_amt']} (feels like {row['tmprtr_feel_like_amt']})\n"
+            f"- Humidity: {row['rel_humidity_amt']}%\n"
+            f"- Wind: {row['wind_speed_amt']} {row['wind_dir_cardinal_str']}"
+        )
+        
+        logger.info(f"Answered query from the city index: {city}")
+        return {
+            'success': True,
+            'answer': answer,
+            'question': user_input,
+            'city_lookup': True
+        }
+    
+    def _get_follow_up_context(self, user_input: str) -> Optional[str]:
+        """
+        Get conversation context for a question that refers to earlier turns.
+        
+        Args:
+            user_input: User's natural language query, not yet in the history
+            
+        Returns:
+            Formatted conversation context, or None if the question stands alone
+        """
+        if not self.conversation_history or not _FOLLOW_UP_RE.search(user_input):
+            return None
+        return self.get_conversation_context() or None
+    
+    def _cache_key(self, user_input: str, context: Optional[str] = None) -> str:
+        """
+        Build the response cache key for a question.
+        
+        Args:
+            user_input: User's natural language query
+            context: Conversation context sent along with the question, if any
+            
+        Returns:
+            Hex digest over the normalized question, context, model, temperature and schema
+        """
+        if self._schema_version != self.agent.schema_version:
+            # The schema changed under us; cached answers may no longer hold
+            self._response_cache.clear()
+            self._schema_hash = None
+            self._schema_version = self.agent.schema_version
+        
+        if self._schema_hash is None:
+            schema_context = self.agent.schema_manager.get_full_context(include_samples=False)
+            self._schema_hash = hashlib.sha256(schema_context.encode("utf-8")).hexdigest()
+        
+        payload = json.dumps({
+            'q': user_input.strip().lower(),
+            'c': context,
+            'm': [self.config.OPENAI_MODEL_SMALL, self.config.OPENAI_MODEL_LARGE],
+            't': self.config.TEMPERATURE,
+            's': self._schema_hash
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
     def _handle_command(self, command: str) -> Dict[str, Any]:
         """
         Handle special commands.
@@ -96,7 +366,7 @@ class WeatherCopilot:
         elif cmd == '/schema':
             return {
                 'success': True,
-                'answer': self.agent.get_schema_info(include_samples=False),
+                'answer': self.agent.get_schema_info(include_samples=True),
                 'is_command': True
             }
         
@@ -108,7 +378,8 @@ class WeatherCopilot:
             }
         
         elif cmd == '/clear':
-            self.conversation_history = []
+            self.conversation_history.clear()
+            self._response_cache.clear()
             return {
                 'success': True,
                 'answer': 'Conversation history cleared.',
@@ -187,13 +458,15 @@ You can ask questions in natural language, and I'll query the weather database f
         if not self.conversation_history:
             return "No conversation history yet."
         
-        formatted = "Conversation History:\n\n"
-        for i, entry in enumerate(self.conversation_history, 1):
+        # Show at most the last 50 messages, numbered by their position in the history
+        start = max(len(self.conversation_history) - 50, 0)
+        parts = ["Conversation History:\n\n"]
+        for i, entry in enumerate(islice(self.conversation_history, start, None), start + 1):
             role = entry['role'].capitalize()
             content = entry['content'][:200] + "..." if len(entry['content']) > 200 else entry['content']
-            formatted += f"{i}. {role}: {content}\n\n"
+            parts.append(f"{i}. {role}: {content}\n\n")
         
-        return formatted
+        return "".join(parts)
     
     def _get_status(self) -> str:
         """Get system status information."""
@@ -202,8 +475,9 @@ System Status:
 
 ✓ Weather Agent: Active
 ✓ Database: {self.config.get_full_table_name()}
-✓ LLM Model: {self.config.OPENAI_MODEL}
+✓ LLM Model: {self.config.OPENAI_MODEL_SMALL} (escalates to {self.config.OPENAI_MODEL_LARGE})
 ✓ Conversation History: {len(self.conversation_history)} messages
+✓ Cached Responses: {len(self._response_cache)}
 ✓ Max Query Results: {self.config.MAX_QUERY_RESULTS}
 """
         return status
@@ -218,13 +492,21 @@ System Status:
         if not self.conversation_history:
             return ""
         
-        context = "Previous conversation:\n"
-        for entry in self.conversation_history[-5:]:  # Last 5 exchanges
-            context += f"{entry['role']}: {entry['content']}\n"
+        parts = ["Previous conversation:\n"]
+        recent = islice(reversed(self.conversation_history), 5)  # Last 5 messages
+        for entry in reversed(list(recent)):
+            parts.append(f"{entry['role']}: {entry['content']}\n")
         
-        return context
+        return "".join(parts)
+    
+    def invalidate_schema_cache(self) -> None:
+        """Re-read the schema on the next query and drop answers built on the old one."""
+        self.agent.invalidate_schema_cache()
+        self._schema_hash = None
+        self._response_cache.clear()
     
     def reset(self) -> None:
         """Reset the copilot state."""
-        self.conversation_history = []
+        self.conversation_history.clear()
+        self._response_cache.clear()
         logger.info("Copilot reset")
@@ -0,0 +1,77 @@
+"""Shared LLM clients for the weather agent."""
+
+import asyncio
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Coroutine, TypeVar
+import httpx
+from langchain_openai import ChatOpenAI
+from src.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Keep-alive HTTP/2 pools shared by every chat model in the process
+_LIMITS = httpx.Limits(max_keepalive_connections=10)
+
+
+@lru_cache(maxsize=None)
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop that owns the shared async HTTP client."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="llm-event-loop", daemon=True).start()
+    return loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the shared event loop and wait for its result.
+    
+    The async HTTP client's pooled connections are bound to the loop they were
+    opened on, so every async LLM call goes through this one loop.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
+
+
+@lru_cache(maxsize=None)
+def _get_http_client() -> httpx.Client:
+    """Get the shared synchronous HTTP client."""
+    return httpx.Client(http2=True, limits=_LIMITS)
+
+
+@lru_cache(maxsize=None)
+def _get_http_async_client() -> httpx.AsyncClient:
+    """Get the shared asynchronous HTTP client."""
+    return httpx.AsyncClient(http2=True, limits=_LIMITS)
+
+
+@lru_cache(maxsize=8)
+def get_llm(model: str, temperature: float) -> ChatOpenAI:
+    """
+    Get a chat model client, reused across agents.
+    
+    Args:
+        model: Model name to use
+        temperature: Sampling temperature
+        
+    Returns:
+        Configured ChatOpenAI client
+    """
+    logger.info(f"Initializing LLM: {model}")
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        openai_api_key=Config.OPENAI_API_KEY,
+        base_url='https://api.fuelix.ai/v1', # Custom base URL
+        streaming=True,
+        http_client=_get_http_client(),
+        http_async_client=_get_http_async_client()
+    )
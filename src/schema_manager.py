@@ -1,25 +1,157 @@
 """Schema manager for BigQuery weather data table."""
 
+import functools
+import hashlib
+import json
 import logging
+import time
 from typing import Dict, List, Any, Optional
 from pathlib import Path
+import pandas as pd
 from src.utils.bigquery_helper import BigQueryHelper
 from src.utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+_SAMPLES_UNAVAILABLE = "\n## Sample Data: Not available\n"
+
+# Sample rows in the prompt are trimmed to this many columns and characters per value
+_SAMPLE_MAX_COLUMNS = 12
+_SAMPLE_MAX_COLWIDTH = 64
+# Bump when the sample rendering changes so stale on-disk blocks are not reused
+_SAMPLE_FORMAT_VERSION = 2
+
+# Query guidelines appended to the schema context; joined once at import
+_GUIDELINE_LINES = (
+    "",
+    "",
+    "## Query Guidelines:",
+    "",
+    "1. Always use the full table name in queries: `{full_table}`",
+    "2. Partitioning by expressions of type FLOAT64 is not allowed in this BigQuery table.",
+    "3. When creating a lat/long buffer in the query try and use ST_DWITHIN for better performance",
+    "    2a. Always convert rqst_lat_num and rqst_long_num from FLOAT64 to GEOGRAPHY type using ST_GEOGPOINT",
+    "4. Use appropriate WHERE clauses to filter data",
+    "5. Consider using LIMIT to restrict result size",
+    "6. Use aggregation functions (AVG, MAX, MIN, COUNT) for analytics",
+    "7. Format timestamps appropriately for time-based queries",
+    "",
+    "## Example Queries:",
+    "",
+    "```sql",
+    "-- Get current weather for a specific location (e.x. TORONTO)",
+    "SELECT tmprtr_amt, ST_BUFFER(ST_GEOGPOINT(-79.39, 43.67), 1000) AS buffer_polygon ",
+    "FROM `{full_table}` ",
+    "LIMIT 25;",
+    "",
+    "-- Find all locations within 5km of a point",
+    "SELECT * ",
+    "FROM `{full_table}` ",
+    "WHERE ST_DWITHIN(ST_GEOGPOINT(rqst_long_num, rqst_lat_num), ST_GEOGPOINT(-79.39, 43.67), 5000);",
+    "",
+    "-- Get recent weather data",
+    "SELECT * FROM `{full_table}` ",
+    "WHERE timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 24 HOUR)",
+    "ORDER BY timestamp DESC;",
+    "```",
+    "",
+)
+_GUIDELINES_TEMPLATE = "\n".join(_GUIDELINE_LINES)
+
+
+# Schema description shipped in the project root
+_SCHEMA_DESCRIPTION_PATH = Path(__file__).resolve().parents[1] / "weather_table_schema.txt"
+
+
+@functools.cache
+def _schema_description_from_file() -> str:
+    """Read the schema description file once per process."""
+    return _SCHEMA_DESCRIPTION_PATH.read_text(encoding="utf-8")
+
+
+@functools.cache
+def _guidelines_block() -> str:
+    """Render the query guidelines for the configured table, once per process."""
+    return _GUIDELINES_TEMPLATE.format(full_table=Config.get_full_table_name())
+
 
 class SchemaManager:
     """Manages BigQuery table schema and provides context for the LLM."""
     
     def __init__(self):
         """Initialize schema manager."""
-        self.bq_helper = BigQueryHelper(Config.GCP_PROJECT_ID)
+        self._bq_helper: Optional[BigQueryHelper] = None
         self.dataset_id = Config.BIGQUERY_DATASET
         self.table_id = Config.BIGQUERY_TABLE
         self._schema_cache = None
         self._table_info_cache = None
-        self._schema_description_cache: Optional[str] = None
+        # Rendered sample blocks by num_samples, persisted to disk since they cost a BigQuery read
+        self._sample_cache_path = Path(Config.SCHEMA_CACHE_DIR).expanduser() / "samples.json"
+        self._sample_description_cache: Dict[int, str] = self._load_sample_cache()
+    
+    @property
+    def bq_helper(self) -> BigQueryHelper:
+        """BigQuery helper, created on first use; the schema description itself needs no client."""
+        if self._bq_helper is None:
+            self._bq_helper = BigQueryHelper(Config.GCP_PROJECT_ID)
+        return self._bq_helper
+    
+    def _get_fingerprint(self) -> str:
+        """
+        Fingerprint the inputs of the rendered sample block.
+        
+        Returns:
+            Hash of the table name and the sample rendering settings
+        """
+        source = json.dumps([
+            Config.get_full_table_name(),
+            _SAMPLE_FORMAT_VERSION,
+            _SAMPLE_MAX_COLUMNS,
+            _SAMPLE_MAX_COLWIDTH,
+        ])
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+    
+    def _load_sample_cache(self) -> Dict[int, str]:
+        """
+        Load rendered sample blocks from disk if they are fresh and match the current rendering.
+        
+        Returns:
+            Cached sample descriptions by num_samples, empty if unavailable or stale
+        """
+        try:
+            if not self._sample_cache_path.exists():
+                return {}
+            age = time.time() - self._sample_cache_path.stat().st_mtime
+            if age > Config.SCHEMA_CACHE_TTL:
+                return {}
+            
+            data = json.loads(self._sample_cache_path.read_text(encoding="utf-8"))
+            if data.get('fingerprint') != self._get_fingerprint():
+                return {}
+            
+            logger.info(f"Loaded sample data cache from {self._sample_cache_path}")
+            return {int(key): value for key, value in data['samples'].items()}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable sample data cache: {e}")
+            return {}
+    
+    def _save_sample_cache(self) -> None:
+        """Write the rendered sample blocks to disk."""
+        try:
+            data = {
+                'fingerprint': self._get_fingerprint(),
+                'samples': {str(key): value for key, value in self._sample_description_cache.items()}
+            }
+            self._sample_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._sample_cache_path.write_text(json.dumps(data), encoding="utf-8")
+        except Exception as e:
+            logger.warning(f"Could not write sample data cache: {e}")
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached schema descriptions and samples, in memory and on disk."""
+        _schema_description_from_file.cache_clear()
+        self._sample_description_cache = {}
+        self._sample_cache_path.unlink(missing_ok=True)
     
     def get_schema(self) -> List[Dict[str, Any]]:
         """
@@ -57,17 +189,9 @@ class SchemaManager:
         Returns:
             Formatted schema description read from weather_table_schema.txt
         """
-        # Use cached content if available
-        if self._schema_description_cache is not None:
-            return self._schema_description_cache
-        
         try:
-            # weather_table_schema.txt is located one directory above this file (project root)
-            schema_path = Path(__file__).resolve().parents[1] / "weather_table_schema.txt"
-            content = schema_path.read_text(encoding="utf-8")
-            # Cache the content for subsequent calls
-            self._schema_description_cache = content
-            return content
+            # Shared across SchemaManager instances; failed reads are not cached
+            return _schema_description_from_file()
         except Exception as e:
             logger.error(f"Error reading schema description from file: {e}")
             # Provide a minimal fallback so the application can continue
@@ -84,6 +208,9 @@ class SchemaManager:
         Returns:
             Formatted sample data
         """
+        if num_samples in self._sample_description_cache:
+            return self._sample_description_cache[num_samples]
+        
         try:
             df = self.bq_helper.get_sample_data(
                 self.dataset_id,
@@ -91,14 +218,22 @@ class SchemaManager:
                 limit=num_samples
             )
             
+            # Representative rather than exhaustive: wide rows and long values only cost prompt tokens
+            df = df.head(num_samples).iloc[:, :_SAMPLE_MAX_COLUMNS].copy()
+            for column in df.select_dtypes(include='object').columns:
+                df[column] = df[column].astype(str).str.slice(0, _SAMPLE_MAX_COLWIDTH)
+            
             description = f"\n## Sample Data ({num_samples} rows):\n\n"
-            description += df.to_string(index=False)
+            with pd.option_context('display.max_colwidth', _SAMPLE_MAX_COLWIDTH):
+                description += df.to_markdown(index=False, tablefmt="github")
             
+            self._sample_description_cache[num_samples] = description
+            self._save_sample_cache()
             return description
             
         except Exception as e:
             logger.error(f"Error getting sample data: {e}")
-            return "\n## Sample Data: Not available\n"
+            return _SAMPLES_UNAVAILABLE
     
     def get_full_context(self, include_samples: bool = True) -> str:
         """
@@ -110,42 +245,9 @@ class SchemaManager:
         Returns:
             Complete schema description with optional samples
         """
-        context = self.get_schema_description()
-        
+        # Every part is cached, so assembling the context is cheap
+        parts = [self.get_schema_description()]
         if include_samples:
-            context += self.get_sample_data_description()
-        
-        context += """
-
-## Query Guidelines:
-
-1. Always use the full table name in queries: `{full_table}`
-2. Partitioning by expressions of type FLOAT64 is not allowed in this BigQuery table.
-3. When creating a lat/long buffer in the query try and use ST_DWITHIN for better performance
-    2a. Always convert rqst_lat_num and rqst_long_num from FLOAT64 to GEOGRAPHY type using ST_GEOGPOINT
-4. Use appropriate WHERE clauses to filter data
-5. Consider using LIMIT to restrict result size
-6. Use aggregation functions (AVG, MAX, MIN, COUNT) for analytics
-7. Format timestamps appropriately for time-based queries
-
-## Example Queries:
-
-```sql
--- Get current weather for a specific location (e.x. TORONTO)
-SELECT tmprtr_amt, ST_BUFFER(ST_GEOGPOINT(-79.39, 43.67), 1000) AS buffer_polygon 
-FROM `{full_table}` 
-LIMIT 25;
-
--- Find all locations within 5km of a point
-SELECT * 
-FROM `{full_table}` 
-WHERE ST_DWITHIN(ST_GEOGPOINT(rqst_long_num, rqst_lat_num), ST_GEOGPOINT(-79.39, 43.67), 5000);
-
--- Get recent weather data
-SELECT * FROM `{full_table}` 
-WHERE timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 24 HOUR)
-ORDER BY timestamp DESC;
-```
-""".format(full_table=Config.get_full_table_name())
-        
-        return context
+            parts.append(self.get_sample_data_description())
+        parts.append(_guidelines_block())
+        return "".join(parts)
@@ -1,16 +1,428 @@
 """BigQuery helper utilities for the weather agent."""
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import google.oauth2.credentials
 from google.cloud import bigquery
+from google.cloud import bigquery_storage
 from google.api_core import exceptions
 import pandas as pd
+import pyarrow as pa
+import sqlglot
+from sqlglot import exp
 from langchain.tools import tool
 from src.utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# BigQuery parameter types for Python parameter values
+_PARAM_TYPES = {
+    bool: "BOOL",
+    int: "INT64",
+    float: "FLOAT64",
+    str: "STRING",
+}
+
+
+def _with_row_limit(query: str, limit: int) -> str:
+    """
+    Add a LIMIT to a query whose top-level statement has none.
+    
+    The clause is appended to the original text rather than regenerating the
+    SQL, so the query BigQuery runs is otherwise exactly what was written.
+    
+    Args:
+        query: SQL query
+        limit: Maximum number of rows to return
+        
+    Returns:
+        The query, with a LIMIT appended if it had none
+    """
+    try:
+        tree = sqlglot.parse_one(query, read="bigquery")
+    except sqlglot.errors.SqlglotError:
+        return query
+    
+    if not isinstance(tree, exp.Query) or tree.args.get("limit") is not None:
+        return query
+    # The newline keeps the clause out of any trailing line comment
+    return f"{query.rstrip().rstrip(';')}\nLIMIT {limit}"
+
+
+# Select clauses a query may use and still be answered from the coverage cache
+_COVERABLE_CLAUSES = {"expressions", "from_", "where", "order", "limit"}
+
+# Node types a cacheable WHERE predicate may be built from
+_PREDICATE_NODES = (
+    exp.Column, exp.Identifier, exp.Literal, exp.Boolean, exp.Null, exp.Neg, exp.Paren,
+    exp.And, exp.Or, exp.Not, exp.EQ, exp.NEQ, exp.GT, exp.GTE, exp.LT, exp.LTE,
+    exp.Between, exp.In, exp.Is,
+)
+
+
+def _literal_value(node: exp.Expression) -> Any:
+    """
+    Get the Python value of a literal expression.
+    
+    Args:
+        node: sqlglot expression
+        
+    Returns:
+        The literal's value
+        
+    Raises:
+        ValueError: If the expression is not a plain literal
+    """
+    if isinstance(node, exp.Neg):
+        return -_literal_value(node.this)
+    if isinstance(node, exp.Boolean):
+        return node.this
+    if isinstance(node, exp.Literal):
+        if node.is_string:
+            return node.this
+        number = float(node.this)
+        return int(number) if number.is_integer() else number
+    raise ValueError(f"Not a literal: {node.sql()}")
+
+
+def _literal_range(node: exp.Expression) -> Optional[Tuple[str, float, bool, float, bool]]:
+    """
+    Describe a numeric comparison on a single column as an interval.
+    
+    Args:
+        node: WHERE conjunct
+        
+    Returns:
+        (column, low, low_inclusive, high, high_inclusive), or None if the
+        conjunct is not a column compared with numeric literals
+    """
+    inf = float("inf")
+    try:
+        if isinstance(node, exp.Between) and isinstance(node.this, exp.Column):
+            low, high = _literal_value(node.args["low"]), _literal_value(node.args["high"])
+            return node.this.name, float(low), True, float(high), True
+        if isinstance(node, (exp.EQ, exp.GT, exp.GTE, exp.LT, exp.LTE)):
+            if not isinstance(node.this, exp.Column):
+                return None
+            value = float(_literal_value(node.expression))
+            column = node.this.name
+            if isinstance(node, exp.EQ):
+                return column, value, True, value, True
+            if isinstance(node, exp.GT):
+                return column, value, False, inf, False
+            if isinstance(node, exp.GTE):
+                return column, value, True, inf, False
+            if isinstance(node, exp.LT):
+                return column, -inf, False, value, False
+            return column, -inf, False, value, True
+    except (ValueError, TypeError):
+        return None
+    return None
+
+
+def _implies(new_conjuncts: List[exp.Expression], cached: exp.Expression) -> bool:
+    """
+    Whether a set of new WHERE conjuncts guarantees a cached conjunct holds.
+    
+    Args:
+        new_conjuncts: Conjuncts of the new query's predicate
+        cached: One conjunct of the cached query's predicate
+        
+    Returns:
+        True if a new conjunct equals the cached one, or the new numeric
+        ranges on its column intersect to within the cached range
+    """
+    if any(new == cached for new in new_conjuncts):
+        return True
+    cached_range = _literal_range(cached)
+    if cached_range is None:
+        return False
+    column, lo, lo_inc, hi, hi_inc = cached_range
+    
+    # Intersect every range the new query puts on the same column
+    new_lo, new_lo_inc, new_hi, new_hi_inc = float("-inf"), False, float("inf"), False
+    for new in new_conjuncts:
+        new_range = _literal_range(new)
+        if new_range is None or new_range[0] != column:
+            continue
+        _, low, low_inc, high, high_inc = new_range
+        if low > new_lo or (low == new_lo and not low_inc):
+            new_lo, new_lo_inc = low, low_inc
+        if high < new_hi or (high == new_hi and not high_inc):
+            new_hi, new_hi_inc = high, high_inc
+    
+    low_ok = new_lo > lo or (new_lo == lo and (lo_inc or not new_lo_inc))
+    high_ok = new_hi < hi or (new_hi == hi and (hi_inc or not new_hi_inc))
+    return low_ok and high_ok
+
+
+def _predicate_mask(node: exp.Expression, df: pd.DataFrame) -> pd.Series:
+    """
+    Evaluate a WHERE predicate over a DataFrame.
+    
+    Args:
+        node: Predicate built from columns, literals, comparisons, BETWEEN,
+            IN, IS [NOT] NULL, AND and OR
+        df: Rows to filter
+        
+    Returns:
+        Boolean mask of rows where the predicate is TRUE. A comparison with
+        NULL is UNKNOWN and counts as False, which gives SQL's result for AND
+        and OR; NOT over UNKNOWN would not, so only IS NOT NULL is negated.
+        
+    Raises:
+        ValueError: If the predicate uses anything else, or an unknown column
+    """
+    if isinstance(node, exp.Paren):
+        return _predicate_mask(node.this, df)
+    if isinstance(node, exp.And):
+        return _predicate_mask(node.this, df) & _predicate_mask(node.expression, df)
+    if isinstance(node, exp.Or):
+        return _predicate_mask(node.this, df) | _predicate_mask(node.expression, df)
+    if isinstance(node, exp.Not):
+        if not isinstance(node.this, exp.Is):
+            raise ValueError(f"Unsupported predicate: {node.sql()}")
+        return ~_predicate_mask(node.this, df)
+    
+    if not isinstance(node.this, exp.Column) or node.this.name not in df.columns:
+        raise ValueError(f"Unsupported predicate: {node.sql()}")
+    column = df[node.this.name]
+    
+    if isinstance(node, exp.Is) and isinstance(node.expression, exp.Null):
+        return column.isna().astype(bool)
+    if isinstance(node, exp.Between):
+        mask = column.between(_literal_value(node.args["low"]), _literal_value(node.args["high"]))
+    elif isinstance(node, exp.In):
+        mask = column.isin([_literal_value(value) for value in node.expressions])
+    else:
+        mask = _compare(node, column)
+    # NaN != x is True in NumPy, but a NULL comparison is never TRUE in SQL
+    return mask.fillna(False).astype(bool) & column.notna()
+
+
+def _compare(node: exp.Expression, column: pd.Series) -> pd.Series:
+    """Evaluate a binary comparison of a column with a literal."""
+    comparisons = {
+        exp.EQ: column.__eq__,
+        exp.NEQ: column.__ne__,
+        exp.GT: column.__gt__,
+        exp.GTE: column.__ge__,
+        exp.LT: column.__lt__,
+        exp.LTE: column.__le__,
+    }
+    for node_type, compare in comparisons.items():
+        if isinstance(node, node_type):
+            return compare(_literal_value(node.expression))
+    raise ValueError(f"Unsupported predicate: {node.sql()}")
+
+
+def _is_scalar_column(column: pd.Series) -> bool:
+    """Whether a column holds scalar values that can be compared and sorted."""
+    if isinstance(column.dtype, pd.ArrowDtype):
+        return not pa.types.is_nested(column.dtype.pyarrow_dtype)
+    if column.dtype != object:
+        return True
+    return pd.api.types.infer_dtype(column, skipna=True) in ("string", "empty")
+
+
+class _CoverableQuery:
+    """A single-table SELECT whose result can be derived from a broader cached one."""
+    
+    def __init__(self, query: str):
+        """
+        Parse a query.
+        
+        Args:
+            query: SQL query
+            
+        Raises:
+            ValueError: If the query is not a plain single-table SELECT of columns
+                with a column/literal WHERE predicate
+        """
+        try:
+            tree = sqlglot.parse_one(query, read="bigquery")
+        except sqlglot.errors.SqlglotError as e:
+            raise ValueError(str(e))
+        
+        if not isinstance(tree, exp.Select):
+            raise ValueError("Not a SELECT")
+        used = {key for key, value in tree.args.items() if value}
+        if not used <= _COVERABLE_CLAUSES or not isinstance(tree.args["from_"].this, exp.Table):
+            raise ValueError("Unsupported clauses")
+        
+        self.columns: Optional[List[str]] = []
+        for select in tree.expressions:
+            if isinstance(select, exp.Star):
+                self.columns = None
+                break
+            if not isinstance(select, exp.Column) or isinstance(select.this, exp.Star):
+                raise ValueError("Only plain columns can be covered")
+            self.columns.append(select.name)
+        
+        table = tree.args["from_"].this
+        self.table = f"{table.catalog}.{table.db}.{table.name}"
+        
+        where = tree.args.get("where")
+        self.predicate = where.this if where is not None else None
+        self.conjuncts = list(self.predicate.flatten()) if isinstance(self.predicate, exp.And) else (
+            [self.predicate] if self.predicate is not None else []
+        )
+        # Only columns and literals: no functions such as CURRENT_TIMESTAMP() whose value drifts
+        if self.predicate is not None and not all(
+            isinstance(node, _PREDICATE_NODES) for node in self.predicate.walk()
+        ):
+            raise ValueError("Predicate is not deterministic")
+        # NOT over a NULL comparison is UNKNOWN, not TRUE; only IS NOT NULL is safe
+        if self.predicate is not None and any(
+            not isinstance(node.this, exp.Is) for node in self.predicate.find_all(exp.Not)
+        ):
+            raise ValueError("Only IS NOT NULL can be negated")
+        
+        order = tree.args.get("order")
+        # sqlglot fills in nulls_first from BigQuery's default: first for ASC, last for DESC
+        self.order = [
+            (ordered.this, bool(ordered.args.get("desc")), bool(ordered.args.get("nulls_first")))
+            for ordered in order.expressions
+        ] if order else []
+        if any(not isinstance(column, exp.Column) for column, _, _ in self.order):
+            raise ValueError("Only column ordering can be covered")
+        # pandas applies one NULL position to every sort key
+        if len({nulls_first for _, _, nulls_first in self.order}) > 1:
+            raise ValueError("Mixed NULL ordering cannot be covered")
+        
+        limit = tree.args.get("limit")
+        self.limit: Optional[int] = int(_literal_value(limit.expression)) if limit else None
+    
+    def answer_from(self, cached: "_CoverableQuery", df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Derive this query's result from a cached query's complete result.
+        
+        Args:
+            cached: Query that produced df
+            df: Complete result of the cached query
+            
+        Returns:
+            This query's result, or None if the cached result does not cover it
+        """
+        if cached.table != self.table:
+            return None
+        if not all(_implies(self.conjuncts, old) for old in cached.conjuncts):
+            return None
+        needed = self.columns if self.columns is not None else None
+        if needed is None and cached.columns is not None:
+            return None
+        referenced = {column.name for column in self.predicate.find_all(exp.Column)} if self.predicate else set()
+        referenced |= {column.name for column, _, _ in self.order}
+        if not (set(needed or ()) | referenced) <= set(df.columns):
+            return None
+        # Comparing or sorting ARRAY/STRUCT values has no pandas equivalent of BigQuery's rules
+        if not all(_is_scalar_column(df[name]) for name in referenced):
+            return None
+        
+        try:
+            result = df[_predicate_mask(self.predicate, df)] if self.predicate is not None else df
+            if self.order:
+                result = result.sort_values(
+                    [column.name for column, _, _ in self.order],
+                    ascending=[not desc for _, desc, _ in self.order],
+                    na_position="first" if self.order[0][2] else "last"
+                )
+        except (ValueError, TypeError, NotImplementedError, pa.ArrowException):
+            return None
+        if self.limit is not None:
+            result = result.head(self.limit)
+        if needed is not None:
+            result = result[needed]
+        return result.reset_index(drop=True)
+
+
+class CoverageCache:
+    """
+    Bounded LRU of query results that also answers narrower follow-up queries.
+    
+    A cached result covers a new query when both select from the same table,
+    the new WHERE predicate implies the cached one (same conjuncts, or tighter
+    literal ranges on the same columns) and the needed columns were fetched.
+    The new query is then answered by filtering the cached rows in pandas.
+    """
+    
+    def __init__(self, max_bytes: int, ttl: float):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_bytes: Memory budget for cached DataFrames
+            ttl: Seconds a cached result may be reused
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[_CoverableQuery, pd.DataFrame, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+    
+    def lookup(self, query: str) -> Optional[pd.DataFrame]:
+        """
+        Answer a query from a covering cached result.
+        
+        Args:
+            query: SQL query
+            
+        Returns:
+            The query's result, or None on a miss
+        """
+        try:
+            parsed = _CoverableQuery(query)
+        except ValueError:
+            return None
+        
+        now = time.time()
+        with self._lock:
+            for key, (cached, df, size, stored_at) in list(self._entries.items()):
+                if now - stored_at > self.ttl:
+                    del self._entries[key]
+                    self._bytes -= size
+                    continue
+                result = parsed.answer_from(cached, df)
+                if result is not None:
+                    self._entries.move_to_end(key)
+                    return result
+        return None
+    
+    def store(self, query: str, df: pd.DataFrame) -> None:
+        """
+        Cache a complete query result.
+        
+        Args:
+            query: SQL query as written, before any row limit was added
+            df: Its complete result
+        """
+        try:
+            parsed = _CoverableQuery(query)
+        except ValueError:
+            return
+        # A LIMIT means the rows are not the full predicate match
+        if parsed.limit is not None:
+            return
+        
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return
+        
+        key = sqlglot.transpile(query, read="bigquery", write="bigquery")[0]
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[2]
+            self._entries[key] = (parsed, df, size, time.time())
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, _, evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
 
 class BigQueryHelper:
     """Helper class for BigQuery operations."""
@@ -24,8 +436,25 @@ class BigQueryHelper:
         """
         self.project_id = project_id
         self.table_project_id = Config.BQ_TABLE_PROJECT_ID
-        self.client = bigquery.Client(project=project_id)
-        logging.info(f"Initialized BigQuery Client for project: {project_id}")
+        # Dry-run outcomes by query text, so retried queries are not re-validated remotely
+        self._dry_run_cached = lru_cache(maxsize=1024)(self._dry_run)
+        self._coverage_cache = CoverageCache(Config.COVERAGE_CACHE_BYTES, Config.COVERAGE_CACHE_TTL)
+    
+    @cached_property
+    def client(self) -> bigquery.Client:
+        """BigQuery client, created on first use to keep auth off the startup path."""
+        # Short queries may run without creating a job, returning rows inline
+        client = bigquery.Client(
+            project=self.project_id,
+            default_job_creation_mode="JOB_CREATION_OPTIONAL"
+        )
+        logging.info("Initialized BigQuery Client for project: %s", self.project_id)
+        return client
+    
+    @cached_property
+    def bqstorage_client(self) -> bigquery_storage.BigQueryReadClient:
+        """BigQuery Storage read client, shared by all downloads so its gRPC channel is reused."""
+        return bigquery_storage.BigQueryReadClient(credentials=self.client._credentials)
     
     def get_table_schema(self, dataset_id: str, table_id: str) -> List[Dict[str, Any]]:
         """
@@ -51,14 +480,14 @@ class BigQueryHelper:
                     'description': field.description or ''
                 })
             
-            logger.info(f"Retrieved schema for {table_ref}: {len(schema_info)} fields")
+            logger.info("Retrieved schema for %s: %s fields", table_ref, len(schema_info))
             return schema_info
             
         except exceptions.NotFound:
-            logger.error(f"Table {dataset_id}.{table_id} not found")
+            logger.error("Table %s.%s not found", dataset_id, table_id)
             raise
         except Exception as e:
-            logger.error(f"Error getting table schema: {e}")
+            logger.error("Error getting table schema: %s", e)
             raise
     
     def get_sample_data(
@@ -79,18 +508,16 @@ class BigQueryHelper:
             DataFrame with sample data
         """
         try:
-            query = f"""
-            SELECT * 
-            FROM `{self.table_project_id}.{dataset_id}.{table_id}` 
-            LIMIT {limit}
-            """
-            
-            df = self.client.query(query).to_dataframe()
-            logger.info(f"Retrieved {len(df)} sample rows from {dataset_id}.{table_id}")
+            # Read rows straight from the table instead of running a query job;
+            # a handful of rows is served fastest by tabledata.list
+            table_ref = f"{self.table_project_id}.{dataset_id}.{table_id}"
+            rows = self.client.list_rows(table_ref, max_results=limit)
+            df = rows.to_dataframe(create_bqstorage_client=False)
+            logger.info("Retrieved %s sample rows from %s.%s", len(df), dataset_id, table_id)
             return df
             
         except Exception as e:
-            logger.error(f"Error getting sample data: {e}")
+            logger.error("Error getting sample data: %s", e)
             raise
     
     def execute_query(
@@ -108,17 +535,114 @@ class BigQueryHelper:
         """
         try: #TODO: Can add javascript within the SQL for more complex processing
     
-            logger.info(f"Executing query: {query[:200]}...")
-            query_job = self.client.query(query)
-            df = query_job.to_dataframe()
+            # Narrower versions of recent queries are filtered locally
+            df = self._coverage_cache.lookup(query)
+            if df is not None:
+                logger.info("Query answered from coverage cache: %s rows", len(df))
+                return df
             
-            logger.info(f"Query returned {len(df)} rows")
+            # self_destruct frees each Arrow column as it is converted, capping peak memory.
+            # NumPy-backed dtypes are kept: ArrowDtype columns break describe() for
+            # NUMERIC, ARRAY and STRUCT results
+            df = self.execute_query_arrow(query).to_pandas(self_destruct=True)
+            
+            # A result cut off by the added LIMIT is not complete enough to cover other queries
+            if len(df) < Config.MAX_QUERY_RESULTS:
+                self._coverage_cache.store(query, df)
+            
+            logger.info("Query returned %s rows", len(df))
             return df
             
         except Exception as e:
-            logger.error(f"Error executing query: {e}")
+            logger.error("Error executing query: %s", e)
             raise
     
+    def execute_query_arrow(self, query: str) -> pa.Table:
+        """
+        Execute a BigQuery SQL query and return the results as an Arrow table.
+        
+        Args:
+            query: SQL query to execute
+            
+        Returns:
+            Arrow table with query results
+        """
+        # Bound the result server-side instead of truncating after download
+        query = _with_row_limit(query, Config.MAX_QUERY_RESULTS)
+        logger.info("Executing query: %.200s...", query)
+        # query_and_wait uses jobs.query, and large results are downloaded
+        # through the BigQuery Storage Read API instead of paginated REST
+        rows = self.client.query_and_wait(query, job_config=self._query_job_config())
+        return rows.to_arrow(bqstorage_client=self.bqstorage_client)
+    
+    def iter_query_pages(self, query: str, page_size: int = 1024) -> Iterator[pd.DataFrame]:
+        """
+        Execute a BigQuery SQL query and yield its results page by page.
+        
+        The first rows are available before the whole result is downloaded.
+        
+        Args:
+            query: SQL query to execute
+            page_size: Rows per page
+            
+        Yields:
+            DataFrames of up to page_size rows
+        """
+        query = _with_row_limit(query, Config.MAX_QUERY_RESULTS)
+        logger.info("Streaming query: %.200s...", query)
+        query_job = self.client.query(query, job_config=self._query_job_config())
+        rows = query_job.result(page_size=page_size)
+        yield from rows.to_dataframe_iterable(bqstorage_client=self.bqstorage_client)
+    
+    def _query_job_config(self) -> bigquery.QueryJobConfig:
+        """Build the job config for agent queries."""
+        return bigquery.QueryJobConfig(
+            use_query_cache=True,
+            use_legacy_sql=False,
+            maximum_bytes_billed=Config.MAX_BYTES_BILLED
+        )
+    
+    def execute_parameterized_query(self, query: str, params: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Execute a BigQuery SQL query with named query parameters.
+        
+        Args:
+            query: SQL query referencing parameters as @name
+            params: Parameter values by name; types are inferred from the values
+            
+        Returns:
+            DataFrame with query results
+        """
+        try:
+            job_config = self._query_job_config()
+            job_config.query_parameters = [
+                bigquery.ScalarQueryParameter(name, _PARAM_TYPES[type(value)], value)
+                for name, value in params.items()
+            ]
+            
+            logger.info("Executing parameterized query: %.200s...", query)
+            rows = self.client.query_and_wait(query, job_config=job_config)
+            df = rows.to_dataframe(bqstorage_client=self.bqstorage_client)
+            
+            logger.info("Query returned %s rows", len(df))
+            return df
+            
+        except Exception as e:
+            logger.error("Error executing parameterized query: %s", e)
+            raise
+    
+    async def execute_query_async(self, query: str) -> pd.DataFrame:
+        """
+        Execute a BigQuery SQL query without blocking the event loop.
+        
+        Args:
+            query: SQL query to execute
+            
+        Returns:
+            DataFrame with query results
+        """
+        return await asyncio.to_thread(self.execute_query, query)
+    
     def get_table_info(self, dataset_id: str, table_id: str) -> Dict[str, Any]:
         """
         Get comprehensive information about a BigQuery table.
@@ -146,11 +670,11 @@ class BigQueryHelper:
                 'description': table.description or ''
             }
             
-            logger.info(f"Retrieved table info for {table_ref}")
+            logger.info("Retrieved table info for %s", table_ref)
             return info
             
         except Exception as e:
-            logger.error(f"Error getting table info: {e}")
+            logger.error("Error getting table info: %s", e)
             raise
     
     def validate_query(self, query: str) -> bool:
@@ -163,13 +687,63 @@ class BigQueryHelper:
         Returns:
             True if query is valid, False otherwise
         """
+        return self.get_validation_error(query) is None
+    
+    async def get_validation_error_async(self, query: str) -> Optional[str]:
+        """
+        Dry-run a SQL query without blocking the event loop.
+        
+        Args:
+            query: SQL query to validate
+            
+        Returns:
+            None if the query is valid, otherwise the validation error message
+        """
+        return await asyncio.to_thread(self.get_validation_error, query)
+    
+    def get_validation_error(self, query: str) -> Optional[str]:
+        """
+        Dry-run a SQL query and report why it is invalid.
+        
+        Args:
+            query: SQL query to validate
+            
+        Returns:
+            None if the query is valid, otherwise the validation error message
+        """
+        # Reject unparseable SQL locally before paying for a dry-run round-trip
         try:
-            job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
-            self.client.query(query, job_config=job_config)
+            sqlglot.parse_one(query, read="bigquery")
+        except sqlglot.errors.SqlglotError as e:
+            logger.error("Query validation failed: %s", e)
+            return f"Syntax error: {e}"
+        
+        try:
+            error = self._dry_run_cached(query)
+        except Exception as e:
+            logger.error("Query validation failed: %s", e)
+            return str(e)
+        
+        if error is None:
             logger.info("Query validation successful")
-            return True
+        else:
+            logger.error("Query validation failed: %s", error)
+        return error
+    
+    def _dry_run(self, query: str) -> Optional[str]:
+        """
+        Dry-run a SQL query on BigQuery.
+        
+        Args:
+            query: SQL query to validate
             
-        except Exception as e:
-            logger.error(f"Query validation failed: {e}")
-            return False
-    
\ No newline at end of file
+        Returns:
+            None if the query is valid, otherwise the error message. Other
+            failures (network, auth) are raised so they are not memoized.
+        """
+        try:
+            job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+            self.client.query(query, job_config=job_config)
+            return None
+        except exceptions.BadRequest as e:
+            return str(e)
@@ -20,6 +20,8 @@ class Config:
     # OpenAI Configuration
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "claude-sonnet-4-5")
+    OPENAI_MODEL_SMALL: str = os.getenv("OPENAI_MODEL_SMALL", "claude-haiku-4-5")
+    OPENAI_MODEL_LARGE: str = os.getenv("OPENAI_MODEL_LARGE", OPENAI_MODEL)
     TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.1"))
     
     # GCP Configuration
@@ -32,6 +34,10 @@ class Config:
     BIGQUERY_DATASET: str = os.getenv("BIGQUERY_DATASET", "ent_common_location")
     BIGQUERY_TABLE: str = os.getenv("BIGQUERY_TABLE", "bq_weather_current")
     
+    # Derived once from the settings above
+    FULL_TABLE_NAME: str = f"{BQ_TABLE_PROJECT_ID}.{BIGQUERY_DATASET}.{BIGQUERY_TABLE}"
+    BIGQUERY_URI: str = f"bigquery://{GCP_PROJECT_ID}/{BIGQUERY_DATASET}"
+    
     # Proxy Configuration
     HTTP_PROXY: Optional[str] = os.getenv("HTTP_PROXY", 'http://198.161.14.25:8080')
     HTTPS_PROXY: Optional[str] = os.getenv("HTTPS_PROXY", 'http://198.161.14.25:8080')
@@ -40,26 +46,35 @@ class Config:
     # Agent Configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     MAX_QUERY_RESULTS: int = int(os.getenv("MAX_QUERY_RESULTS", "1000"))
+    SMALL_MODEL_MAX_TOOL_CALLS: int = int(os.getenv("SMALL_MODEL_MAX_TOOL_CALLS", "4"))
+    SCHEMA_CACHE_DIR: str = os.getenv("SCHEMA_CACHE_DIR", os.path.expanduser("~/.cache/bb-weather"))
+    SCHEMA_CACHE_TTL: int = int(os.getenv("SCHEMA_CACHE_TTL", "86400"))
+    MAX_HISTORY_MESSAGES: int = int(os.getenv("MAX_HISTORY_MESSAGES", "20"))
+    MAX_BYTES_BILLED: int = int(os.getenv("MAX_BYTES_BILLED", str(10 * 1024**3)))
+    COVERAGE_CACHE_BYTES: int = int(os.getenv("COVERAGE_CACHE_BYTES", str(256 * 1024**2)))
+    COVERAGE_CACHE_TTL: int = int(os.getenv("COVERAGE_CACHE_TTL", "300"))
+    RESPONSE_CACHE_SIZE: int = int(os.getenv("RESPONSE_CACHE_SIZE", "256"))
+    RESPONSE_CACHE_TTL: int = int(os.getenv("RESPONSE_CACHE_TTL", "3600"))
     
     @classmethod
     def get_bigquery_uri(cls) -> str:
         """Get the BigQuery connection URI."""
-        return f"bigquery://{cls.GCP_PROJECT_ID}/{cls.BIGQUERY_DATASET}"
+        return cls.BIGQUERY_URI
     
     @classmethod
     def get_full_table_name(cls) -> str:
         """Get the full BigQuery table name."""
-        return f"{cls.BQ_TABLE_PROJECT_ID}.{cls.BIGQUERY_DATASET}.{cls.BIGQUERY_TABLE}"
+        return cls.FULL_TABLE_NAME
     
     @classmethod
     def setup_proxy(cls) -> None:
         """Set up proxy configuration if provided."""
-        if cls.HTTP_PROXY:
-            os.environ['HTTP_PROXY'] = cls.HTTP_PROXY
-        if cls.HTTPS_PROXY:
-            os.environ['HTTPS_PROXY'] = cls.HTTPS_PROXY
-        if cls.NO_PROXY:
-            os.environ['NO_PROXY'] = cls.NO_PROXY
+        proxies = {
+            'HTTP_PROXY': cls.HTTP_PROXY,
+            'HTTPS_PROXY': cls.HTTPS_PROXY,
+            'NO_PROXY': cls.NO_PROXY,
+        }
+        os.environ.update({name: value for name, value in proxies.items() if value})
     
     @classmethod
     def validate(cls) -> bool:
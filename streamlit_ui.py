@@ -1,21 +1,38 @@
 """Streamlit UI for the weather agent."""
 
+from itertools import groupby
+
 import streamlit as st
+from src.agent import WeatherAgent
 from src.copilot import WeatherCopilot
 
+
+@st.cache_resource
+def get_agent() -> WeatherAgent:
+    """Create the stateless agent (LLM and BigQuery clients) once per server process."""
+    return WeatherAgent()
+
+
+def get_copilot() -> WeatherCopilot:
+    """Get this browser session's copilot, which holds its conversation state."""
+    if "copilot" not in st.session_state:
+        st.session_state.copilot = WeatherCopilot(agent=get_agent())
+    return st.session_state.copilot
+
+
 def main():
     """Main entry point for the Streamlit UI."""
 
-    # Initialize the copilot
-    copilot = WeatherCopilot()
-
-    # Set page title and icon
+    # Set page title and icon; must be the first Streamlit call
     st.set_page_config(
         page_title="Weather Agent",
         page_icon=":sunny:",
         layout="wide"
     )
 
+    # Per-session copilot around the shared agent
+    copilot = get_copilot()
+
     # Display welcome message
     st.title("🌤️ Weather Data Agent")
     st.write("Welcome! I'm your AI assistant for querying weather data from BigQuery.")
@@ -42,10 +59,11 @@ Type your question or command below to get started!
     if "messages" not in st.session_state:
         st.session_state.messages = []
 
-    # Display chat messages from history on app rerun
-    for message in st.session_state.messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
+    # Display chat messages from history on app rerun. Streamlit redraws the whole
+    # page each run, so consecutive turns from one role share a single container
+    for role, group in groupby(st.session_state.messages, key=lambda message: message["role"]):
+        with st.chat_message(role):
+            st.markdown("\n\n---\n\n".join(message["content"] for message in group))
 
     # Accept user input
     if prompt := st.chat_input("What would you like to know about the weather?"):
@@ -60,29 +78,30 @@ Type your question or command below to get started!
         with st.spinner("Processing your query..."):
             result = copilot.process_query(prompt)
 
+        # Format the response
+        if result.get('success'):
+            answer = result.get('answer', 'No answer provided')
+
+            # Check if it's a command response
+            if result.get('is_command'):
+                content = f"**Command Response:** {answer}"
+            else:
+                # Regular query response
+                content = f"**🤖 Assistant:** {answer}"
+
+                # Add notes/follow-up suggestions if available
+                if 'notes' in result:
+                    content += f"\n\n**📝 Notes:** {result['notes']}"
+        else:
+            error_msg = result.get('answer', 'An error occurred')
+            content = f"**❌ Error:** {error_msg}"
+
         # Display the response
         with st.chat_message("assistant"):
-            if result.get('success'):
-                # Display the answer
-                answer = result.get('answer', 'No answer provided')
-
-                # Check if it's a command response
-                if result.get('is_command'):
-                    st.markdown(f"**Command Response:** {answer}")
-                else:
-                    # Regular query response
-                    st.markdown(f"**🤖 Assistant:** {answer}")
-
-                    # Display notes/follow-up suggestions if available
-                    if 'notes' in result:
-                        st.markdown(f"**📝 Notes:** {result['notes']}")
-            else:
-                # Display error
-                error_msg = result.get('answer', 'An error occurred')
-                st.markdown(f"**❌ Error:** {error_msg}")
+            st.markdown(content)
 
-        # Add assistant response to chat history
-        st.session_state.messages.append({"role": "assistant", "content": answer})
+        # Add assistant response to chat history exactly as displayed
+        st.session_state.messages.append({"role": "assistant", "content": content})
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,61 @@
+"""Tests for BigQueryHelper query result conversion."""
+
+import decimal
+import unittest
+from unittest import mock
+
+import pyarrow as pa
+
+from src.utils.bigquery_helper import BigQueryHelper
+
+try:
+    from src.agent import _format_result
+except ImportError:  # langchain without create_agent
+    _format_result = None
+
+_ROWS = 60  # above the agent's 50-row summary threshold
+
+
+def _helper_returning(table: pa.Table) -> BigQueryHelper:
+    """BigQueryHelper whose client returns the given Arrow table for any query."""
+    helper = BigQueryHelper("project")
+    client = mock.Mock()
+    client.query_and_wait.return_value.to_arrow.return_value = table
+    helper.__dict__["client"] = client
+    helper.__dict__["bqstorage_client"] = None
+    return helper
+
+
+def _mixed_table() -> pa.Table:
+    """NUMERIC, ARRAY and STRUCT columns as the Storage API returns them."""
+    return pa.table({
+        "amount": pa.array([decimal.Decimal("1.250000000")] * _ROWS, pa.decimal128(38, 9)),
+        "readings": pa.array([[1, 2]] * _ROWS, pa.list_(pa.int64())),
+        "station": pa.array([{"id": 1}] * _ROWS),
+        "temp": pa.array([float(i) for i in range(_ROWS)]),
+    })
+
+
+class ExecuteQueryTest(unittest.TestCase):
+    """execute_query results must survive the agent's result formatting."""
+
+    def test_complex_columns_can_be_summarized(self):
+        df = _helper_returning(_mixed_table()).execute_query(
+            "SELECT amount, readings, station, temp FROM `p.d.t`"
+        )
+        self.assertEqual(len(df), _ROWS)
+        summary = df.describe(include='all').round(3).to_csv()
+        self.assertIn("amount", summary)
+        self.assertIn("readings", summary)
+
+    @unittest.skipIf(_format_result is None, "src.agent needs a langchain with create_agent")
+    def test_format_result_summarizes_complex_columns(self):
+        df = _helper_returning(_mixed_table()).execute_query(
+            "SELECT amount, readings, station, temp FROM `p.d.t`"
+        )
+        text = _format_result(df)
+        self.assertTrue(text.startswith(f"summary ({_ROWS} rows):"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Tests for the BigQuery query coverage cache."""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.utils.bigquery_helper import CoverageCache
+
+_CACHED_QUERY = "SELECT lat, city FROM `p.d.t` WHERE lat BETWEEN 40 AND 52"
+
+
+def _rows() -> pd.DataFrame:
+    """Cached result with a NULL latitude."""
+    return pd.DataFrame({
+        "lat": [43.1, np.nan, 49.9, 45.2],
+        "city": ["Toronto", "Unknown", "Winnipeg", "Ottawa"],
+    })
+
+
+class CoverageCacheTest(unittest.TestCase):
+    """Results served from the cache must match what BigQuery would return."""
+
+    def setUp(self):
+        self.cache = CoverageCache(max_bytes=10**8, ttl=300)
+        self.cache.store(_CACHED_QUERY, _rows())
+
+    def test_narrower_range_is_covered(self):
+        df = self.cache.lookup("SELECT city FROM `p.d.t` WHERE lat >= 45 AND lat < 50")
+        self.assertEqual(sorted(df["city"]), ["Ottawa", "Winnipeg"])
+
+    def test_broader_range_is_not_covered(self):
+        self.assertIsNone(self.cache.lookup("SELECT city FROM `p.d.t` WHERE lat > 30"))
+
+    def test_untokenizable_query_is_a_miss(self):
+        self.assertIsNone(self.cache.lookup("SELECT 'abc FROM `p.d.t`"))
+        self.cache.store("SELECT 'abc FROM `p.d.t`", _rows())
+        self.assertIsNone(self.cache.lookup("SELECT 'abc FROM `p.d.t`"))
+
+    def test_not_is_not_served(self):
+        # BigQuery drops the NULL-lat row for NOT lat > 44; the cache must not guess
+        query = "SELECT city FROM `p.d.t` WHERE lat BETWEEN 40 AND 52 AND NOT lat > 44"
+        self.assertIsNone(self.cache.lookup(query))
+
+    def test_not_equal_excludes_nulls(self):
+        self.cache.store("SELECT lat, city FROM `p.d.t`", _rows())
+        df = self.cache.lookup("SELECT city FROM `p.d.t` WHERE lat != 43.1")
+        self.assertEqual(sorted(df["city"]), ["Ottawa", "Winnipeg"])
+
+    def test_is_not_null(self):
+        self.cache.store("SELECT lat, city FROM `p.d.t`", _rows())
+        df = self.cache.lookup("SELECT city FROM `p.d.t` WHERE lat IS NOT NULL")
+        self.assertEqual(len(df), 3)
+
+    def test_ascending_order_puts_nulls_first(self):
+        self.cache.store("SELECT lat, city FROM `p.d.t`", _rows())
+        df = self.cache.lookup("SELECT city FROM `p.d.t` ORDER BY lat LIMIT 2")
+        self.assertEqual(list(df["city"]), ["Unknown", "Toronto"])
+
+    def test_descending_order_puts_nulls_last(self):
+        self.cache.store("SELECT lat, city FROM `p.d.t`", _rows())
+        df = self.cache.lookup("SELECT city FROM `p.d.t` ORDER BY lat DESC")
+        self.assertEqual(list(df["city"]), ["Winnipeg", "Ottawa", "Toronto", "Unknown"])
+
+    def test_explicit_null_ordering(self):
+        self.cache.store("SELECT lat, city FROM `p.d.t`", _rows())
+        df = self.cache.lookup("SELECT city FROM `p.d.t` ORDER BY lat DESC NULLS FIRST LIMIT 1")
+        self.assertEqual(list(df["city"]), ["Unknown"])
+
+
+class CoverageCacheNestedColumnTest(unittest.TestCase):
+    """ARRAY columns are never compared or sorted locally."""
+
+    def _cache_with(self, df: pd.DataFrame) -> CoverageCache:
+        cache = CoverageCache(max_bytes=10**8, ttl=300)
+        cache.store("SELECT lat, readings FROM `p.d.t`", df)
+        return cache
+
+    def _rows(self) -> pa.Table:
+        return pa.table({
+            "lat": [43.1, 45.2, 49.9],
+            "readings": pa.array([[1], [2], [3]], pa.list_(pa.int64())),
+        })
+
+    def test_arrow_list_column_is_a_miss(self):
+        cache = self._cache_with(self._rows().to_pandas(types_mapper=pd.ArrowDtype))
+        self.assertIsNone(cache.lookup("SELECT lat FROM `p.d.t` ORDER BY readings"))
+        self.assertIsNone(cache.lookup("SELECT lat FROM `p.d.t` WHERE readings = 1"))
+
+    def test_numpy_list_column_is_a_miss(self):
+        cache = self._cache_with(self._rows().to_pandas())
+        self.assertIsNone(cache.lookup("SELECT lat FROM `p.d.t` WHERE readings = 1"))
+
+    def test_list_column_can_still_be_selected(self):
+        cache = self._cache_with(self._rows().to_pandas(types_mapper=pd.ArrowDtype))
+        df = cache.lookup("SELECT readings FROM `p.d.t` WHERE lat > 44")
+        self.assertEqual(len(df), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()